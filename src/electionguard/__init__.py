@@ -228,6 +228,7 @@ from electionguard.group import (
     a_minus_b_q,
     a_plus_bc_q,
     add_q,
+    batch_mult_inv_p,
     div_p,
     div_q,
     g_pow_p,
@@ -518,6 +519,7 @@ __all__ = [
     "ballot_is_valid_for_election",
     "ballot_is_valid_for_style",
     "ballot_validator",
+    "batch_mult_inv_p",
     "chaum_pedersen",
     "combine_election_public_keys",
     "compensate_decrypt",
@@ -61,18 +61,24 @@ class PrimeOption(Enum):
     TestOnly = "TestOnly"
 
 
+_CONSTANTS_BY_OPTION = {
+    PrimeOption.Standard.value: STANDARD_CONSTANTS,
+    PrimeOption.TestOnly.value: LARGE_TEST_CONSTANTS,
+}
+"""Constants for each prime option, keyed by the value of the option"""
+
+
 def get_constants() -> ElectionConstants:
     """Get constants for the election by the option for the primes."""
     env_option = getenv("PRIME_OPTION")
-    option: PrimeOption = (
-        PrimeOption(env_option) if env_option is not None else PrimeOption.Standard
-    )
-
-    option_map = {
-        PrimeOption.Standard: STANDARD_CONSTANTS,
-        PrimeOption.TestOnly: LARGE_TEST_CONSTANTS,
-    }
-    return option_map.get(option) or STANDARD_CONSTANTS
+    if env_option is None:
+        return STANDARD_CONSTANTS
+
+    # Looked up by value since this runs on every modular operation
+    constants = _CONSTANTS_BY_OPTION.get(env_option)
+    if constants is None:
+        raise ValueError(f"{env_option!r} is not a valid {PrimeOption.__name__}")
+    return constants
 
 
 get_large_prime = lambda: get_constants().large_prime
@@ -1,4 +1,4 @@
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from .ballot import SubmittedBallot, CiphertextContest, CiphertextSelection
 from .decryption_share import (
@@ -7,7 +7,7 @@ from .decryption_share import (
     get_shares_for_selection,
 )
 from .discrete_log import DiscreteLog
-from .group import ElementModP, ElementModQ, mult_p, div_p
+from .group import ElementModP, ElementModQ, batch_mult_inv_p, mult_inv_p, mult_p
 from .tally import (
     CiphertextTally,
     PlaintextTally,
@@ -103,13 +103,16 @@ def decrypt_contest_with_decryption_shares(
     :return: a collection of `PlaintextTallyContest` or `None` if there is an error
     """
     plaintext_selections: Dict[SelectionId, PlaintextTallySelection] = {}
+    selection_shares: List[
+        Tuple[
+            CiphertextSelection,
+            Dict[GuardianId, Tuple[ElementModP, CiphertextDecryptionSelection]],
+        ]
+    ] = []
 
     for selection in contest.selections:
         tally_shares = get_shares_for_selection(selection.object_id, shares)
-        plaintext_selection = decrypt_selection_with_decryption_shares(
-            selection, tally_shares, crypto_extended_base_hash
-        )
-        if plaintext_selection is None:
+        if not _are_shares_valid(selection, tally_shares, crypto_extended_base_hash):
             log_warning(
                 (
                     f"could not decrypt contest {contest.object_id} "
@@ -117,6 +120,19 @@ def decrypt_contest_with_decryption_shares(
                 )
             )
             return None
+        selection_shares.append((selection, tally_shares))
+
+    # Invert the share products of every selection at once rather than one at a time
+    share_product_inverses = batch_mult_inv_p(
+        [_product_of_shares(tally_shares) for (_, tally_shares) in selection_shares]
+    )
+
+    for (selection, tally_shares), inverse in zip(
+        selection_shares, share_product_inverses
+    ):
+        plaintext_selection = _decrypt_selection_with_inverse(
+            selection, tally_shares, inverse
+        )
         plaintext_selections[plaintext_selection.object_id] = plaintext_selection
 
     return PlaintextTallyContest(contest.object_id, plaintext_selections)
@@ -138,26 +154,51 @@ def decrypt_selection_with_decryption_shares(
     :param suppress_validity_check: do not validate the encryption prior to decrypting (useful for tests)
     :return: a `PlaintextTallySelection` or `None` if there is an error
     """
-    if not suppress_validity_check:
-        # Verify that all of the shares are computed correctly
-        for share in shares.values():
-            public_key, decryption = share
-            # verify we have a proof or recovered parts
-            if not decryption.is_valid(
-                selection.ciphertext, public_key, crypto_extended_base_hash
-            ):
-                log_warning(
-                    f"share: {decryption.object_id} has invalid proof or recovered parts"
-                )
-                return None
+    if not suppress_validity_check and not _are_shares_valid(
+        selection, shares, crypto_extended_base_hash
+    ):
+        return None
 
-    # accumulate all of the shares calculated for the selection
-    all_shares_product_M = mult_p(
-        *[decryption.share for (_, decryption) in shares.values()]
+    return _decrypt_selection_with_inverse(
+        selection, shares, mult_inv_p(_product_of_shares(shares))
     )
 
+
+def _are_shares_valid(
+    selection: CiphertextSelection,
+    shares: Dict[GuardianId, Tuple[ElementModP, CiphertextDecryptionSelection]],
+    crypto_extended_base_hash: ElementModQ,
+) -> bool:
+    """Verify that all of the shares for a selection are computed correctly."""
+    for share in shares.values():
+        public_key, decryption = share
+        # verify we have a proof or recovered parts
+        if not decryption.is_valid(
+            selection.ciphertext, public_key, crypto_extended_base_hash
+        ):
+            log_warning(
+                f"share: {decryption.object_id} has invalid proof or recovered parts"
+            )
+            return False
+    return True
+
+
+def _product_of_shares(
+    shares: Dict[GuardianId, Tuple[ElementModP, CiphertextDecryptionSelection]]
+) -> ElementModP:
+    """Accumulate all of the shares calculated for the selection."""
+    return mult_p(*[decryption.share for (_, decryption) in shares.values()])
+
+
+def _decrypt_selection_with_inverse(
+    selection: CiphertextSelection,
+    shares: Dict[GuardianId, Tuple[ElementModP, CiphertextDecryptionSelection]],
+    all_shares_product_M_inverse: ElementModP,
+) -> PlaintextTallySelection:
+    """Decrypt the selection given the inverse of the product of its shares."""
+
     # Calculate 𝑀=𝐵⁄(∏𝑀𝑖) mod 𝑝.
-    decrypted_value = div_p(selection.ciphertext.data, all_shares_product_M)
+    decrypted_value = mult_p(selection.ciphertext.data, all_shares_product_M_inverse)
     d_log = DiscreteLog().discrete_log(decrypted_value)
     return PlaintextTallySelection(
         selection.object_id,
@@ -6,16 +6,35 @@ made about timing or other side-channels.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Final, Optional, Tuple, Union
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from base64 import b16decode
-from secrets import randbelow
+from os import urandom
 from sys import maxsize
 
 # pylint: disable=no-name-in-module
-from gmpy2 import mpz, powmod, invert
+from pydantic import create_model
+from gmpy2 import mpz, cmp, powmod, invert
 
-from .serialize import Serializable, Private
-from .constants import get_large_prime, get_small_prime, get_generator
+from .constants import (
+    ElectionConstants,
+    get_constants,
+    get_large_prime,
+    get_small_prime,
+)
 
 
 def hex_to_int(input: str) -> int:
@@ -32,41 +51,206 @@ def int_to_hex(input: int) -> str:
 
 
 _zero = mpz(0)
+_one = mpz(1)
 
+_GENERATOR_WINDOW_BITS = 5
+"""Bits of the exponent consumed per lookup in the fixed-base table for g"""
 
-def _mpz_zero() -> mpz:
-    return _zero
+_GeneratorTable = Tuple[Tuple[mpz, ...], ...]
 
 
-def _convert_to_element(data: Union[int, str]) -> Tuple[str, int]:
-    """Convert element to consistent types"""
-    if isinstance(data, str):
-        hex = data
-        integer = hex_to_int(data)
-    else:
-        hex = int_to_hex(data)
-        integer = data
-    return (hex, integer)
+def _build_generator_table(
+    generator: mpz, large_prime: mpz, exponent_bits: int
+) -> _GeneratorTable:
+    """
+    Precompute the fixed-base table `T[i][w] = g^(w * 2^(i * k)) mod p` for g_pow_p.
+
+    :param generator: Base g of the table
+    :param large_prime: Modulus p
+    :param exponent_bits: Largest exponent bit length the table must cover
+    """
+    window_size = 1 << _GENERATOR_WINDOW_BITS
+    rows = -(-exponent_bits // _GENERATOR_WINDOW_BITS)
+    table = []
+    base = generator
+    for _ in range(rows):
+        row = [mpz(1), base]
+        for _ in range(2, window_size):
+            row.append((row[-1] * base) % large_prime)
+        table.append(tuple(row))
+        base = (row[-1] * base) % large_prime
+    return tuple(table)
+
+
+@dataclass(frozen=True)
+class _Moduli:
+    """The election constants used by the group math, converted to mpz once."""
+
+    constants: ElectionConstants
+    """election constants these moduli were built from"""
+
+    large_prime: mpz
+    """large prime or p"""
+
+    small_prime: mpz
+    """small prime or q"""
+
+    generator: mpz
+    """generator or g"""
+
+
+_moduli: Optional[_Moduli] = None
+
+
+def _refresh_moduli() -> _Moduli:
+    """
+    Get the moduli for the active election constants.
+
+    The constants can be swapped at runtime (see `PRIME_OPTION`), so the cached
+    mpz values are rebuilt whenever the active constants change.
+    """
+    global _moduli  # pylint: disable=global-statement
+    constants = get_constants()
+    if _moduli is None or _moduli.constants is not constants:
+        _moduli = _Moduli(
+            constants,
+            mpz(constants.large_prime),
+            mpz(constants.small_prime),
+            mpz(constants.generator),
+        )
+    return _moduli
+
+
+_generator_table: Optional[Tuple[_Moduli, _GeneratorTable]] = None
+
+
+def _get_generator_table(moduli: _Moduli) -> _GeneratorTable:
+    """
+    Get the fixed-base table of powers of g covering exponents in [0, 2^bits(q)).
+
+    The table is large, so it is only built on the first g_pow_p call for the
+    given moduli rather than alongside them.
+    """
+    global _generator_table  # pylint: disable=global-statement
+    if _generator_table is None or _generator_table[0] is not moduli:
+        table = _build_generator_table(
+            moduli.generator, moduli.large_prime, moduli.small_prime.bit_length()
+        )
+        _generator_table = (moduli, table)
+    return _generator_table[1]
 
 
-class BaseElement(Serializable, ABC):
+_ElementT = TypeVar("_ElementT", bound="BaseElement")
+
+
+class BaseElement(ABC):
     """An element limited by mod T within [0, T) where T is determined by an upper_bound function."""
 
+    # Elements are created in every arithmetic operation, so they use slots rather than
+    # a pydantic model. Serialization is provided by `to_json` and the pydantic hooks below.
+    __slots__ = ("_value", "data")
+
     data: str
 
-    _value: mpz = Private(default_factory=_mpz_zero)
+    _value: mpz
     """Internal math representation of element"""
 
     def __init__(self, data: Union[int, str], check_within_bounds: bool = True) -> None:
         """Instantiate element mod T where element is an int or its hex representation."""
-        (hex, integer) = _convert_to_element(data)
-        super().__init__(data=hex)
-        self._value = mpz(integer)
+        if isinstance(data, str):
+            self.data = data
+            self._value = mpz(hex_to_int(data))
+        else:
+            # The hex representation is only computed if it is used, see __getattr__
+            self._value = mpz(data)
 
         if check_within_bounds:
             if not self.is_in_bounds():
                 raise OverflowError
 
+    @classmethod
+    def _from_mpz(cls: Type[_ElementT], value: mpz) -> _ElementT:
+        """
+        Instantiate an element from an mpz without checking it is within [0, T).
+
+        Skips bounds checking and the hex conversion, which is computed on
+        first use instead. Used for the already reduced results of the arithmetic
+        below, and by the converters that check bounds themselves.
+        """
+        element: _ElementT = object.__new__(cls)
+        element._value = value
+        return element
+
+    @classmethod
+    def _from_hex(cls: Type[_ElementT], hex: str) -> _ElementT:
+        """
+        Instantiate an element from a hex string, keeping the string as its representation.
+
+        Skips bounds checking, which is left to the caller.
+        """
+        element = cls._from_mpz(mpz(hex_to_int(hex)))
+        element.data = hex
+        return element
+
+    def __getattr__(self, name: str) -> Any:
+        """Compute and keep the hex representation of elements created from an int on first access."""
+        if name == "data":
+            hex = int_to_hex(self.get_value())
+            self.data = hex
+            return hex
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'"
+        )
+
+    def __getstate__(self) -> Tuple[mpz, Optional[str]]:
+        """Pickle the value and, once set, the hex representation of the element."""
+        try:
+            # Bypass __getattr__ so pickling never computes the hex representation
+            data: Optional[str] = object.__getattribute__(self, "data")
+        except AttributeError:
+            data = None
+        return (self._value, data)
+
+    def __setstate__(self, state: Tuple[mpz, Optional[str]]) -> None:
+        """Restore an element pickled by `__getstate__`."""
+        self._value, data = state
+        if data is not None:
+            self.data = data
+
+    def to_json(self) -> Dict[str, str]:
+        """Convert the element to its JSON representation."""
+        return {"data": self.to_hex()}
+
+    @classmethod
+    def from_json(cls: Type[_ElementT], obj: Any) -> _ElementT:
+        """
+        Convert a JSON representation or another element to this element type.
+
+        :raises TypeError: if the object cannot represent an element
+        """
+        if isinstance(obj, cls):
+            return obj
+        if isinstance(obj, BaseElement):
+            return cls(obj.to_hex())
+        if isinstance(obj, dict) and isinstance(obj.get("data"), str):
+            return cls(obj["data"])
+        raise TypeError(f"{obj!r} is not a valid {cls.__name__}")
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], Any]]:
+        """Validate elements as pydantic fields."""
+        yield cls.from_json
+
+    def __init_subclass__(cls) -> None:
+        """Describe each element type to pydantic by a model of its JSON representation."""
+        super().__init_subclass__()
+        # pydantic emits a shared schema definition, referenced by `$ref`, for types
+        # with a model, rather than inlining the element schema at every field
+        model = create_model(cls.__name__, __module__=cls.__module__, data=(str, ...))
+        if cls.__doc__:
+            model.__doc__ = cls.__doc__
+        setattr(cls, "__pydantic_model__", model)
+
     def __str__(self) -> str:
         """Overload string representation"""
         return self.data
@@ -79,38 +263,41 @@ class BaseElement(Serializable, ABC):
         """Overload int conversion."""
         return int(self.get_value())
 
+    def _compare(self, other: Any) -> Optional[int]:
+        """
+        Compare against another element or an int directly on the mpz values.
+
+        :return: The sign of self - other, or None if other is not comparable
+        """
+        if isinstance(other, int):
+            return cmp(self._value, other)
+        if isinstance(other, BaseElement):
+            return cmp(self._value, other.get_value())
+        return None
+
     def __eq__(self, other: Any) -> bool:
         """Overload == (equal to) operator."""
-        return (
-            isinstance(other, BaseElement)
-            and int(self.get_value()) == int(other.get_value())
-        ) or (isinstance(other, int) and int(self.get_value()) == other)
+        return self._compare(other) == 0
 
     def __ne__(self, other: Any) -> bool:
         """Overload != (not equal to) operator."""
-        return not self == other
+        return self._compare(other) != 0
 
     def __lt__(self, other: Any) -> bool:
         """Overload <= (less than) operator."""
-        return (
-            isinstance(other, BaseElement)
-            and int(self.get_value()) < int(other.get_value())
-        ) or (isinstance(other, int) and int(self.get_value()) < other)
+        return self._compare(other) == -1
 
     def __le__(self, other: Any) -> bool:
         """Overload <= (less than or equal) operator."""
-        return self.__lt__(other) or self.__eq__(other)
+        return self._compare(other) in (-1, 0)
 
     def __gt__(self, other: Any) -> bool:
         """Overload > (greater than) operator."""
-        return (
-            isinstance(other, BaseElement)
-            and int(self.get_value()) > int(other.get_value())
-        ) or (isinstance(other, int) and int(self.get_value()) > other)
+        return self._compare(other) == 1
 
     def __ge__(self, other: Any) -> bool:
         """Overload >= (greater than or equal) operator."""
-        return self.__gt__(other) or self.__eq__(other)
+        return self._compare(other) in (0, 1)
 
     def __add__(self, other: Any) -> Any:
         """Overload addition operator."""
@@ -122,7 +309,7 @@ class BaseElement(Serializable, ABC):
 
     def __hash__(self) -> int:
         """Overload the hashing function."""
-        return hash(self.get_value())
+        return hash(self._value)
 
     @abstractmethod
     def get_upper_bound(self) -> int:
@@ -166,6 +353,8 @@ class BaseElement(Serializable, ABC):
 class ElementModQ(BaseElement):
     """An element of the smaller `mod q` space, i.e., in [0, Q), where Q is a 256-bit prime."""
 
+    __slots__ = ()
+
     def get_upper_bound(self) -> int:
         """Get the upper bound for the element."""
         return get_small_prime()
@@ -174,13 +363,15 @@ class ElementModQ(BaseElement):
 class ElementModP(BaseElement):
     """An element of the larger `mod p` space, i.e., in [0, P), where P is a 4096-bit prime."""
 
+    __slots__ = ()
+
     def get_upper_bound(self) -> int:
         """Get the upper bound for the element."""
         return get_large_prime()
 
     def is_valid_residue(self) -> bool:
         """Validate that this element is in Z^r_p."""
-        residue = pow_p(self, get_small_prime()) == ONE_MOD_P
+        residue = pow_p(self, _refresh_moduli().small_prime) == ONE_MOD_P
         return self.is_in_bounds() and residue
 
 
@@ -199,11 +390,14 @@ ElementModQorInt = Union[ElementModQ, int]
 ElementModPorInt = Union[ElementModP, int]
 
 
+# The helpers below read and build the internal mpz of elements directly
+# pylint: disable=protected-access
+
+
 def _get_mpz(input: Union[BaseElement, int]) -> mpz:
     """Get BaseElement or integer as mpz."""
-    if isinstance(input, BaseElement):
-        return input.get_value()
-    return mpz(input)
+    # Checking the concrete int types is cheaper than an isinstance check against the ABC
+    return mpz(input) if isinstance(input, (int, mpz)) else input._value
 
 
 def hex_to_q(input: str) -> Optional[ElementModQ]:
@@ -212,10 +406,8 @@ def hex_to_q(input: str) -> Optional[ElementModQ]:
 
     Returns `None` if the number is out of the allowed [0,Q) range.
     """
-    try:
-        return ElementModQ(input)
-    except OverflowError:
-        return None
+    element = ElementModQ._from_hex(input)
+    return element if element.is_in_bounds() else None
 
 
 def int_to_q(input: int) -> Optional[ElementModQ]:
@@ -224,10 +416,8 @@ def int_to_q(input: int) -> Optional[ElementModQ]:
 
     Returns `None` if the number is out of the allowed [0,Q) range.
     """
-    try:
-        return ElementModQ(input)
-    except OverflowError:
-        return None
+    element = ElementModQ._from_mpz(mpz(input))
+    return element if element.is_in_bounds() else None
 
 
 def hex_to_p(input: str) -> Optional[ElementModP]:
@@ -236,10 +426,8 @@ def hex_to_p(input: str) -> Optional[ElementModP]:
 
     Returns `None` if the number is out of the allowed [0,Q) range.
     """
-    try:
-        return ElementModP(input)
-    except OverflowError:
-        return None
+    element = ElementModP._from_hex(input)
+    return element if element.is_in_bounds() else None
 
 
 def int_to_p(input: int) -> Optional[ElementModP]:
@@ -248,46 +436,45 @@ def int_to_p(input: int) -> Optional[ElementModP]:
 
     Returns `None` if the number is out of the allowed [0,P) range.
     """
-    try:
-        return ElementModP(input)
-    except OverflowError:
-        return None
+    element = ElementModP._from_mpz(mpz(input))
+    return element if element.is_in_bounds() else None
 
 
 def add_q(*elems: ElementModQorInt) -> ElementModQ:
     """Add together one or more elements in Q, returns the sum mod Q."""
-    sum = _get_mpz(0)
+    q = _refresh_moduli().small_prime
+    sum = _zero
     for e in elems:
-        e = _get_mpz(e)
-        sum = (sum + e) % get_small_prime()
-    return ElementModQ(sum)
+        sum = (sum + (mpz(e) if isinstance(e, (int, mpz)) else e._value)) % q
+    return ElementModQ._from_mpz(sum)
 
 
 def a_minus_b_q(a: ElementModQorInt, b: ElementModQorInt) -> ElementModQ:
     """Compute (a-b) mod q."""
     a = _get_mpz(a)
     b = _get_mpz(b)
-    return ElementModQ((a - b) % get_small_prime())
+    return ElementModQ._from_mpz((a - b) % _refresh_moduli().small_prime)
 
 
 def div_p(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModP:
     """Compute a/b mod p."""
     b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_large_prime()))
+    inverse = invert(b, _refresh_moduli().large_prime)
     return mult_p(a, inverse)
 
 
 def div_q(a: ElementModPOrQorInt, b: ElementModPOrQorInt) -> ElementModQ:
     """Compute a/b mod q."""
     b = _get_mpz(b)
-    inverse = invert(b, _get_mpz(get_small_prime()))
+    inverse = invert(b, _refresh_moduli().small_prime)
     return mult_q(a, inverse)
 
 
 def negate_q(a: ElementModQorInt) -> ElementModQ:
     """Compute (Q - a) mod q."""
     a = _get_mpz(a)
-    return ElementModQ(get_small_prime() - a)
+    q = _refresh_moduli().small_prime
+    return ElementModQ._from_mpz((q - a) % q)
 
 
 def a_plus_bc_q(
@@ -297,7 +484,7 @@ def a_plus_bc_q(
     a = _get_mpz(a)
     b = _get_mpz(b)
     c = _get_mpz(c)
-    return ElementModQ((a + b * c) % get_small_prime())
+    return ElementModQ._from_mpz((a + b * c) % _refresh_moduli().small_prime)
 
 
 def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
@@ -308,7 +495,39 @@ def mult_inv_p(e: ElementModPOrQorInt) -> ElementModP:
     """
     e = _get_mpz(e)
     assert e != 0, "No multiplicative inverse for zero"
-    return ElementModP(powmod(e, -1, get_large_prime()))
+    return ElementModP._from_mpz(powmod(e, -1, _refresh_moduli().large_prime))
+
+
+def batch_mult_inv_p(elems: Sequence[ElementModPOrQorInt]) -> List[ElementModP]:
+    """
+    Compute the multiplicative inverses mod p of many elements at once.
+
+    Uses Montgomery's trick so only a single modular inversion is performed,
+    at the cost of roughly three multiplications per element.
+
+    :param elems: Zero or more elements in [1, P).
+    :return: The inverses in the same order as `elems`
+    """
+    if not elems:
+        return []
+    p = _refresh_moduli().large_prime
+    values = [_get_mpz(e) for e in elems]
+
+    # prefixes[i] is the product of values[0..i]
+    prefixes = []
+    product = mpz(1)
+    for value in values:
+        assert value != 0, "No multiplicative inverse for zero"
+        product = (product * value) % p
+        prefixes.append(product)
+
+    inverse = invert(prefixes[-1], p)
+    inverses = [_zero] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = (inverse * prefixes[i - 1]) % p
+        inverse = (inverse * values[i]) % p
+    inverses[0] = inverse
+    return [ElementModP._from_mpz(value) for value in inverses]
 
 
 def pow_p(b: ElementModPOrQorInt, e: ElementModPOrQorInt) -> ElementModP:
@@ -320,7 +539,7 @@ def pow_p(b: ElementModPOrQorInt, e: ElementModPOrQorInt) -> ElementModP:
     """
     b = _get_mpz(b)
     e = _get_mpz(e)
-    return ElementModP(powmod(b, e, get_large_prime()))
+    return ElementModP._from_mpz(powmod(b, e, _refresh_moduli().large_prime))
 
 
 def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
@@ -332,7 +551,7 @@ def pow_q(b: ElementModQorInt, e: ElementModQorInt) -> ElementModQ:
     """
     b = _get_mpz(b)
     e = _get_mpz(e)
-    return ElementModQ(powmod(b, e, get_small_prime()))
+    return ElementModQ._from_mpz(powmod(b, e, _refresh_moduli().small_prime))
 
 
 def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
@@ -341,11 +560,11 @@ def mult_p(*elems: ElementModPOrQorInt) -> ElementModP:
 
     :param elems: Zero or more elements in [0,P).
     """
-    product = _get_mpz(1)
+    p = _refresh_moduli().large_prime
+    product = _one
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_large_prime()
-    return ElementModP(product)
+        product = (product * (mpz(x) if isinstance(x, (int, mpz)) else x._value)) % p
+    return ElementModP._from_mpz(product)
 
 
 def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
@@ -354,11 +573,11 @@ def mult_q(*elems: ElementModPOrQorInt) -> ElementModQ:
 
     :param elems: Zero or more elements in [0,Q).
     """
-    product = _get_mpz(1)
+    q = _refresh_moduli().small_prime
+    product = _one
     for x in elems:
-        x = _get_mpz(x)
-        product = (product * x) % get_small_prime()
-    return ElementModQ(product)
+        product = (product * (mpz(x) if isinstance(x, (int, mpz)) else x._value)) % q
+    return ElementModQ._from_mpz(product)
 
 
 def g_pow_p(e: ElementModPOrQorInt) -> ElementModP:
@@ -367,7 +586,40 @@ def g_pow_p(e: ElementModPOrQorInt) -> ElementModP:
 
     :param e: An element in [0,P).
     """
-    return pow_p(get_generator(), e)
+    moduli = _refresh_moduli()
+    e = _get_mpz(e)
+    table = _get_generator_table(moduli)
+    if e < 0 or e.bit_length() > len(table) * _GENERATOR_WINDOW_BITS:
+        return ElementModP._from_mpz(powmod(moduli.generator, e, moduli.large_prime))
+
+    # Fixed-base windowing: one table lookup and multiply per k-bit digit of e
+    p = moduli.large_prime
+    mask = (1 << _GENERATOR_WINDOW_BITS) - 1
+    result = mpz(1)
+    for row in table:
+        if not e:
+            break
+        digit = e & mask
+        if digit:
+            result = (result * row[digit]) % p
+        e >>= _GENERATOR_WINDOW_BITS
+    return ElementModP._from_mpz(result)
+
+
+def _rand_below(bound: mpz) -> mpz:
+    """
+    Generate a uniformly random number in [0, bound) by rejection sampling.
+
+    :param bound: Exclusive upper bound, must be positive
+    :return: Random value between 0 and bound
+    """
+    bits = bound.bit_length()
+    count = (bits + 7) // 8
+    excess = count * 8 - bits
+    while True:
+        value = mpz(int.from_bytes(urandom(count), "big") >> excess)
+        if value < bound:
+            return value
 
 
 def rand_q() -> ElementModQ:
@@ -376,7 +628,7 @@ def rand_q() -> ElementModQ:
 
     :return: Random value between 0 and Q
     """
-    return ElementModQ(randbelow(get_small_prime()))
+    return ElementModQ._from_mpz(_rand_below(_refresh_moduli().small_prime))
 
 
 def rand_range_q(start: ElementModQorInt) -> ElementModQ:
@@ -387,7 +639,8 @@ def rand_range_q(start: ElementModQorInt) -> ElementModQ:
     :return: Random value between start and Q
     """
     start = _get_mpz(start)
-    random = 0
+    q = _refresh_moduli().small_prime
+    random = _zero
     while random < start:
-        random = randbelow(get_small_prime())
-    return ElementModQ(random)
+        random = _rand_below(q)
+    return ElementModQ._from_mpz(random)
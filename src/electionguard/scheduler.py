@@ -8,12 +8,26 @@ from multiprocessing.dummy import Pool as ThreadPool
 from multiprocessing.pool import Pool
 from psutil import cpu_count
 
+# pylint: disable=no-name-in-module
+from gmpy2 import get_context
+
 from .logs import log_warning
 from .singleton import Singleton
 
 _T = TypeVar("_T")
 
 
+def _allow_release_gil() -> None:
+    """
+    Let gmpy2 release the GIL during long running operations on this thread,
+    so math heavy tasks on the thread pool can run concurrently.
+    Only available from gmpy2 2.1.
+    """
+    context = get_context()
+    if hasattr(context, "allow_release_gil"):
+        context.allow_release_gil = True
+
+
 class Scheduler(Singleton, AbstractContextManager):
     """
     Worker that wraps Multprocessing and allows
@@ -44,7 +58,7 @@ class Scheduler(Singleton, AbstractContextManager):
         if max_processes > 2:
             max_processes = max_processes - 1
         self.__process_pool = ProcessPool(max_processes)
-        self.__thread_pool = ThreadPool(max_processes)
+        self.__thread_pool = ThreadPool(max_processes, _allow_release_gil)
 
     def close(self) -> None:
         """Close pools"""
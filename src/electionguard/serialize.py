@@ -8,6 +8,8 @@ from pydantic import BaseModel, PrivateAttr
 from pydantic.json import pydantic_encoder
 from pydantic.tools import parse_raw_as, parse_obj_as, schema_json_of
 
+from .group import BaseElement
+
 Private = PrivateAttr
 
 
@@ -22,6 +24,15 @@ class Serializable(BaseModel):
 
 _T = TypeVar("_T")
 
+
+def _json_encoder(obj: Any) -> Any:
+    """Encode objects for JSON, including the group elements pydantic does not know."""
+
+    if isinstance(obj, BaseElement):
+        return obj.to_json()
+    return pydantic_encoder(obj)
+
+
 _indent = 2
 _encoding = "utf-8"
 _file_extension = "json"
@@ -47,7 +58,7 @@ def from_raw(type_: Type[_T], obj: Any) -> _T:
 def to_raw(data: Any) -> Any:
     """Serialize data to raw json format."""
 
-    return json.dumps(data, indent=_indent, default=pydantic_encoder)
+    return json.dumps(data, indent=_indent, default=_json_encoder)
 
 
 def from_file_wrapper(type_: Type[_T], file: TextIOWrapper) -> _T:
@@ -101,7 +112,7 @@ def to_file(
         "w",
         encoding=_encoding,
     ) as outfile:
-        json.dump(data, outfile, indent=_indent, default=pydantic_encoder)
+        json.dump(data, outfile, indent=_indent, default=_json_encoder)
 
 
 def get_schema(_type: Any) -> str:
@@ -264,13 +264,41 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
         cast_ballot_selections: Dict[
             SelectionId, Dict[BallotId, ElGamalCiphertext]
         ] = {}
-        for ballot in ballots:
-            # get the value of the dict
-            ballot_value = ballot[1]
-            if not self.__contains__(ballot) and ballot_is_valid_for_election(
-                ballot_value, self._internal_manifest, self._encryption
-            ):
+
+        if scheduler is None:
+            scheduler = Scheduler()
+
+        # get the value of the dict
+        candidate_ballots = [
+            ballot[1] for ballot in ballots if not self.__contains__(ballot)
+        ]
+
+        # each ballot's proofs are verified independently, so validate them in parallel.
+        # threads are used since manifests are not guaranteed to be picklable
+        validity: List[bool] = scheduler.schedule(
+            ballot_is_valid_for_election,
+            [
+                (ballot_value, self._internal_manifest, self._encryption)
+                for ballot_value in candidate_ballots
+            ],
+            with_shared_resources=True,
+        )
+        if len(validity) != len(candidate_ballots):
+            # the scheduler logs and swallows task errors, so validate each ballot
+            # here instead to surface any error with the ballot that raised it
+            log_warning("batch_append could not validate ballots in parallel")
+            validity = [
+                ballot_is_valid_for_election(
+                    ballot_value, self._internal_manifest, self._encryption
+                )
+                for ballot_value in candidate_ballots
+            ]
+
+        cast_ballot_ids: List[BallotId] = []
+        for ballot_value, is_valid in zip(candidate_ballots, validity):
+            if is_valid:
                 if ballot_value.state == BallotBoxState.CAST:
+                    cast_ballot_ids.append(ballot_value.object_id)
 
                     # collect the selections so they can can be accumulated in parallel
                     for contest in ballot_value.contests:
@@ -288,11 +316,7 @@ class CiphertextTally(ElectionObjectBase, Container, Sized):
 
         # cache the cast ballot id's so they are not double counted
         if self._execute_accumulate(cast_ballot_selections, scheduler):
-            for ballot in ballots:
-                # get the value of the dict
-                ballot_value = ballot[1]
-                if ballot_value.state == BallotBoxState.CAST:
-                    self.cast_ballot_ids.add(ballot_value.object_id)
+            self.cast_ballot_ids.update(cast_ballot_ids)
             return True
 
         return False
@@ -82,6 +82,8 @@ class mpz(int):
     def __trunc__(self) -> mpz: ...
     def __xor__(self, other: int) -> mpz: ...
 
+def cmp(x: int, y: int) -> int: ...
+def get_context() -> Any: ...
 def invert(x: mpz, m: mpz) -> mpz: ...
 def powmod(a: int, e: int, p: int) -> mpz: ...
 def to_binary(a: mpz) -> bytes: ...
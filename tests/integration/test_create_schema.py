@@ -4,6 +4,7 @@ from shutil import rmtree
 
 from electionguard.constants import ElectionConstants
 from electionguard.election import CiphertextElectionContext
+from electionguard.elgamal import ElGamalCiphertext
 from electionguard.guardian import GuardianRecord
 from electionguard.manifest import Manifest
 from electionguard.ballot import (
@@ -105,3 +106,19 @@ class TestCreateSchema(TestCase):
 
         if self.remove_schema:
             rmtree(self.schema_dir)
+
+    def test_schema_references_element_definitions(self) -> None:
+        # Act
+        schema = json.loads(get_schema(ElGamalCiphertext))
+
+        # Assert
+        definitions = schema["definitions"]
+        self.assertEqual(
+            {"$ref": "#/definitions/ElementModP"},
+            definitions["ElGamalCiphertext"]["properties"]["pad"],
+        )
+        self.assertEqual(
+            {"data": {"title": "Data", "type": "string"}},
+            definitions["ElementModP"]["properties"],
+        )
+        self.assertEqual(["data"], definitions["ElementModP"]["required"])
@@ -1,10 +1,16 @@
-from typing import Optional
+import os
+from copy import deepcopy
+from pickle import dumps, loads
+from typing import List, Optional
+from unittest.mock import patch
 
 from hypothesis import given
+from hypothesis.strategies import lists
 
 from tests.base_test_case import BaseTestCase
 
 from electionguard.constants import (
+    PrimeOption,
     get_small_prime,
     get_large_prime,
     get_generator,
@@ -14,20 +20,28 @@ from electionguard.group import (
     ElementModP,
     ElementModQ,
     a_minus_b_q,
+    batch_mult_inv_p,
     mult_inv_p,
+    negate_q,
     ONE_MOD_P,
     mult_p,
     ZERO_MOD_P,
     ONE_MOD_Q,
     g_pow_p,
+    pow_p,
     ZERO_MOD_Q,
+    int_to_hex,
     int_to_p,
     int_to_q,
     add_q,
     div_q,
     div_p,
     a_plus_bc_q,
+    rand_q,
+    rand_range_q,
 )
+from electionguard.hash import hash_elems
+from electionguard.serialize import from_raw, to_raw
 from electionguard.utils import (
     flatmap_optional,
     get_or_else_optional,
@@ -73,6 +87,11 @@ class TestEquality(BaseTestCase):
         self.assertEqual(p, p)
         self.assertEqual(q, q)
 
+        # equal values must hash alike so elements and ints share dict keys
+        self.assertEqual(hash(p), hash(q))
+        self.assertEqual(hash(q), hash(i))
+        self.assertEqual({i: True}.get(p), True)
+
 
 class TestModularArithmetic(BaseTestCase):
     """Math Modular Arithmetic tests"""
@@ -95,6 +114,11 @@ class TestModularArithmetic(BaseTestCase):
         as_elem = a_minus_b_q(q, ElementModQ(1))
         self.assertEqual(as_int, as_elem)
 
+    @given(elements_mod_q())
+    def test_negate_q(self, q: ElementModQ) -> None:
+        self.assertEqual(ZERO_MOD_Q, add_q(q, negate_q(q)))
+        self.assertEqual(ZERO_MOD_Q, negate_q(ZERO_MOD_Q))
+
     @given(elements_mod_q())
     def test_div_q(self, q: ElementModQ) -> None:
         as_int = div_q(q, 1)
@@ -115,6 +139,11 @@ class TestModularArithmetic(BaseTestCase):
         inv = mult_inv_p(elem)
         self.assertEqual(mult_p(elem, inv), ONE_MOD_P)
 
+    @given(lists(elements_mod_p_no_zero(), max_size=10))
+    def test_batch_mult_inverses(self, elems: List[ElementModP]) -> None:
+        inverses = batch_mult_inv_p(elems)
+        self.assertEqual([mult_inv_p(elem) for elem in elems], inverses)
+
     @given(elements_mod_p())
     def test_mult_identity(self, elem: ElementModP) -> None:
         self.assertEqual(elem, mult_p(elem))
@@ -196,6 +225,78 @@ class TestModularArithmetic(BaseTestCase):
         self.assertEqual(None, int_to_q(oversize))
 
 
+class TestGeneratorPowers(BaseTestCase):
+    """Generator power tests"""
+
+    @given(elements_mod_q())
+    def test_g_pow_p_matches_pow_p(self, e: ElementModQ) -> None:
+        self.assertEqual(pow_p(get_generator(), e), g_pow_p(e))
+
+    @given(elements_mod_p())
+    def test_g_pow_p_large_exponent(self, e: ElementModP) -> None:
+        self.assertEqual(pow_p(get_generator(), e), g_pow_p(e))
+
+    def test_powers_follow_prime_option(self) -> None:
+        test_only_generator = g_pow_p(ONE_MOD_Q)
+        with patch.dict(os.environ, {"PRIME_OPTION": PrimeOption.Standard.value}):
+            standard_generator = g_pow_p(ONE_MOD_Q)
+            self.assertEqual(int_to_p(get_generator()), standard_generator)
+        self.assertNotEqual(test_only_generator, standard_generator)
+        self.assertEqual(test_only_generator, g_pow_p(ONE_MOD_Q))
+
+
+class TestResidues(BaseTestCase):
+    """Residue tests"""
+
+    @given(elements_mod_q())
+    def test_generated_elements_are_valid_residues(self, e: ElementModQ) -> None:
+        self.assertTrue(g_pow_p(e).is_valid_residue())
+
+    @given(elements_mod_p())
+    def test_valid_residue_matches_subgroup_order(self, p: ElementModP) -> None:
+        in_subgroup = pow(int(p), get_small_prime(), get_large_prime()) == 1
+        self.assertEqual(in_subgroup, p.is_valid_residue())
+
+
+class TestElementSerialization(BaseTestCase):
+    """Element serialization tests"""
+
+    @given(elements_mod_p(), elements_mod_q())
+    def test_arithmetic_results_match_constructed(
+        self, p: ElementModP, q: ElementModQ
+    ) -> None:
+        product = mult_p(p, ONE_MOD_P)
+        total = add_q(q, ZERO_MOD_Q)
+        self.assertEqual(int_to_hex(int(p)), p.to_hex())
+        self.assertEqual(p.to_hex(), product.to_hex())
+        self.assertEqual(q.to_hex(), total.to_hex())
+        self.assertEqual(p, from_raw(ElementModP, to_raw(mult_p(p, ONE_MOD_P))))
+        self.assertEqual(q, from_raw(ElementModQ, to_raw(add_q(q, ZERO_MOD_Q))))
+
+    @given(elements_mod_p(), elements_mod_q())
+    def test_elements_pickle(self, p: ElementModP, q: ElementModQ) -> None:
+        self.assertEqual(p, loads(dumps(p)))
+        self.assertEqual(q, loads(dumps(q)))
+        self.assertEqual(p.to_hex(), loads(dumps(mult_p(p))).to_hex())
+
+    def test_elements_pickle_keep_hex(self) -> None:
+        padded = ElementModP("0005")
+        self.assertEqual("0005", loads(dumps(padded)).to_hex())
+        self.assertEqual("0005", deepcopy(padded).to_hex())
+        self.assertEqual(hash_elems(padded), hash_elems(loads(dumps(padded))))
+
+
+class TestRandom(BaseTestCase):
+    """Random element tests"""
+
+    @given(elements_mod_q())
+    def test_random_elements_in_bounds(self, q: ElementModQ) -> None:
+        self.assertTrue(rand_q().is_in_bounds())
+        random = rand_range_q(q)
+        self.assertTrue(random.is_in_bounds())
+        self.assertGreaterEqual(random, q)
+
+
 class TestOptionalFunctions(BaseTestCase):
     """Math Optional Functions tests"""
 
@@ -217,6 +217,52 @@ class TestTally(BaseTestCase):
         first_ballot.state = BallotBoxState.SPOILED
         self.assertFalse(tally.append(first_ballot))
 
+    @settings(
+        deadline=timedelta(milliseconds=10000),
+        suppress_health_check=[HealthCheck.too_slow],
+        max_examples=3,
+        # disabling the "shrink" phase, because it runs very slowly
+        phases=[Phase.explicit, Phase.reuse, Phase.generate, Phase.target],
+    )
+    @given(integers(2, 4).flatmap(lambda n: elections_and_ballots(n)))
+    def test_batch_append_skips_invalid_ballots(
+        self, everything: ElectionsAndBallotsTupleType
+    ):
+        # Arrange
+        (
+            _election_description,
+            internal_manifest,
+            ballots,
+            _secret_key,
+            context,
+        ) = everything
+
+        store = DataStore()
+        encryption_seed = ElectionFactory.get_encryption_device().get_hash()
+        for ballot in ballots:
+            encrypted_ballot = encrypt_ballot(
+                ballot, internal_manifest, context, encryption_seed
+            )
+            encryption_seed = encrypted_ballot.code
+            self.assertIsNotNone(encrypted_ballot)
+            store.set(
+                encrypted_ballot.object_id,
+                from_ciphertext_ballot(encrypted_ballot, BallotBoxState.CAST),
+            )
+
+        # invalidate the first ballot by changing its manifest hash
+        invalid_ballot = store.all()[0]
+        invalid_ballot.manifest_hash = ONE_MOD_Q
+        tally = CiphertextTally("my-tally", internal_manifest, context)
+
+        # Act
+        result = tally.batch_append(store)
+
+        # Assert
+        self.assertTrue(result)
+        self.assertNotIn(invalid_ballot.object_id, tally.cast_ballot_ids)
+        self.assertEqual(len(ballots) - 1, tally.cast())
+
     @staticmethod
     def _decrypt_with_secret(
         tally: CiphertextTally, secret_key: ElGamalSecretKey
@@ -49,3 +49,10 @@ class TestConstants(BaseTestCase):
         self.assertEqual(constants.small_prime, get_small_prime())
         self.assertEqual(constants.cofactor, get_cofactor())
         self.assertEqual(constants.generator, get_generator())
+
+    @patch.dict(os.environ, {"PRIME_OPTION": "Unknown"})
+    def test_get_unknown_primes(self):
+        """Test an unknown prime option is rejected."""
+        # Act & Assert
+        with self.assertRaises(ValueError):
+            get_constants()